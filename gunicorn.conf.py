@@ -0,0 +1,18 @@
+import os
+
+# At most this many workers unless WEB_CONCURRENCY says otherwise; with the
+# default DB_POOL_MAX that stays well under Postgres' max_connections = 100
+MAX_DEFAULT_WORKERS = 4
+
+def _default_workers():
+    # CPUs this process may run on, not the host's total core count
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    return min(cpus, MAX_DEFAULT_WORKERS)
+
+# Picked up automatically by `gunicorn main:app`
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+worker_class = "uvicorn_worker.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", _default_workers()))